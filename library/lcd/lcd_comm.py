@@ -36,6 +36,9 @@ from PIL import Image, ImageDraw, ImageFont
 from library.log import logger
 from library.lcd.color import Color, parse_color
 
+# The platform cannot change while the program is running: check it once instead of at every serial write
+IS_MACOS = platform.system() == "Darwin"
+
 
 class Orientation(IntEnum):
     PORTRAIT = 0
@@ -142,7 +145,7 @@ class LcdComm(ABC):
     def WriteLine(self, line: bytes):
         try:
             self.serial_write(line)
-            if platform.system() == "Darwin":
+            if IS_MACOS:
                 # macOS needs the serial buffer to be flushed regularly to avoid bitmap corruption on the display
                 # See https://github.com/mathoudebine/turing-smart-screen-python/issues/7
                 self.lcd_serial.flush()
@@ -395,14 +398,10 @@ class LcdComm(ABC):
 
         # if autoscale is enabled, define new min/max value to "zoom" the graph
         if autoscale:
-            trueMin = max_value
-            trueMax = min_value
-            for value in values:
-                if not math.isnan(value):
-                    if trueMin > value:
-                        trueMin = value
-                    if trueMax < value:
-                        trueMax = value
+            # Filter out NaN values once, then let builtin min/max do the reduction
+            valid_values = [value for value in values if not math.isnan(value)]
+            trueMin = min([max_value, *valid_values])
+            trueMax = max([min_value, *valid_values])
 
             if trueMin != max_value and trueMax != min_value:
                 min_value = max(trueMin - 5, min_value)
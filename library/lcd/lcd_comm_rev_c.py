@@ -36,6 +36,10 @@ from library.lcd.serialize import image_to_BGRA, image_to_BGR, chunked
 from library.log import logger
 
 
+# Characters kept from the display ID returned by HELLO command, built once instead of for every received character
+PRINTABLE_CHARACTERS = frozenset(string.printable)
+
+
 class Count:
     Start = 0
 
@@ -212,21 +216,23 @@ class LcdCommRevC(LcdComm):
             if readsize:
                 self.update_queue.put((self.ReadData, [readsize]))
 
+    def _read_hello_response(self) -> str:
+        # Display ID is returned on 23 bytes, keep only its printable characters
+        return ''.join(c for c in self.serial_read(23).decode(errors="ignore") if c in PRINTABLE_CHARACTERS)
+
     def _hello(self):
         # This command reads LCD answer on serial link, so it bypasses the queue
         self.sub_revision = SubRevision.UNKNOWN
         self.serial_flush_input()
         self._send_command(Command.HELLO, bypass_queue=True)
-        response = ''.join(
-            filter(lambda x: x in set(string.printable), str(self.serial_read(23).decode(errors="ignore"))))
+        response = self._read_hello_response()
         self.serial_flush_input()
         logger.debug("Display ID returned: %s" % response)
         while not response.startswith("chs_"):
             logger.warning("Display returned invalid or unsupported ID, try again in 1 second")
             time.sleep(1)
             self._send_command(Command.HELLO, bypass_queue=True)
-            response = ''.join(
-                filter(lambda x: x in set(string.printable), str(self.serial_read(23).decode(errors="ignore"))))
+            response = self._read_hello_response()
             self.serial_flush_input()
             logger.debug("Display ID returned: %s" % response)
 
@@ -247,7 +253,7 @@ class LcdCommRevC(LcdComm):
             if self.rom_version < 80 or self.rom_version > 100:
                 logger.warning("ROM version %d may be invalid, use default ROM version 87" % self.rom_version)
                 self.rom_version = 87
-        except:
+        except (IndexError, ValueError):
             logger.warning("Display returned invalid or unsupported ID, use default ROM version 87")
             self.rom_version = 87
 
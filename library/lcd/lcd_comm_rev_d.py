@@ -18,6 +18,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import struct
 from enum import Enum
 
 from serial.tools.list_ports import comports
@@ -26,6 +27,9 @@ from library.lcd.lcd_comm import *
 from library.lcd.serialize import image_to_RGB565, chunked
 from library.log import logger
 
+# BLOCKWRITE payload: x0, x1, y0, y1 bitmap coordinates as 16-bit big-endian values
+BLOCKWRITE_COORDINATES = struct.Struct('>4H')
+
 
 class Command(Enum):
     GETINFO = bytearray((71, 00, 00, 00))
@@ -166,11 +170,7 @@ class LcdCommRevD(LcdComm):
             image_width, image_height = image_height, image_width
 
         # Send bitmap size
-        image_data = bytearray()
-        image_data += x0.to_bytes(2, "big")
-        image_data += x1.to_bytes(2, "big")
-        image_data += y0.to_bytes(2, "big")
-        image_data += y1.to_bytes(2, "big")
+        image_data = BLOCKWRITE_COORDINATES.pack(x0, x1, y0, y1)
         self.SendCommand(cmd=Command.BLOCKWRITE, payload=image_data)
 
         # Prepare bitmap data transmission
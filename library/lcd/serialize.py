@@ -59,16 +59,14 @@ def image_to_BGRA(image: Image.Image) -> (bytes, int):
     return bgra.tobytes(), 4
 
 
-# FIXME: to optimize like other functions above
 def image_to_compressed_BGRA(image: Image.Image) -> (bytes, int):
-    compressed_bgra = bytearray()
-    image_data = image.convert("RGBA").load()
-    for h in range(image.height):
-        for w in range(image.width):
-            # r = pixel[0], g = pixel[1], b = pixel[2], a = pixel[3]
-            pixel = image_data[w, h]
-            a = pixel[3] >> 4
-            compressed_bgra.append(pixel[2] & 0xFC | a >> 2)
-            compressed_bgra.append(pixel[1] & 0xFC | a & 2)
-            compressed_bgra.append(pixel[0])
-    return bytes(compressed_bgra), 3
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    rgba = np.asarray(image)
+    # 4-bit alpha is spread over the 2 low bits of B and G channels
+    a = rgba[:, :, 3] >> 4
+    compressed_bgra = np.empty((image.height, image.width, 3), dtype=np.uint8)
+    compressed_bgra[:, :, 0] = rgba[:, :, 2] & 0xFC | a >> 2
+    compressed_bgra[:, :, 1] = rgba[:, :, 1] & 0xFC | a & 2
+    compressed_bgra[:, :, 2] = rgba[:, :, 0]
+    return compressed_bgra.tobytes(), 3
@@ -72,7 +72,8 @@ def schedule(interval):
             """ Wrapper to create our schedule and run it at the appropriate time """
             if interval == 0:
                 return
-            scheduler = sched.scheduler(time.time, time.sleep)
+            # Use a monotonic clock: periodic tasks must not be delayed or rushed by system clock changes
+            scheduler = sched.scheduler(time.monotonic, time.sleep)
             periodic(scheduler, interval, func)
             scheduler.run()
 
@@ -53,6 +53,12 @@ class Cpu(ABC):
 
 
 class Gpu(ABC):
+    @staticmethod
+    def update():
+        # Called once at the beginning of each GPU refresh, before the other GPU sensors are read
+        # Can be overriden by libraries that need to poll the hardware once for all sensors of a refresh
+        pass
+
     @staticmethod
     @abstractmethod
     def stats() -> Tuple[
@@ -120,6 +126,12 @@ class Disk(ABC):
 
 
 class Net(ABC):
+    @staticmethod
+    def update():
+        # Called once at the beginning of each network refresh, before the stats of each interface are read
+        # Can be overriden by libraries that read the counters of all interfaces at once
+        pass
+
     @staticmethod
     @abstractmethod
     def stats(if_name, interval) -> Tuple[
@@ -21,12 +21,18 @@
 # This file allows to add custom data source as sensors and display them in System Monitor themes
 # There is no limitation on how much custom data source classes can be added to this file
 # See CustomDataExample theme for the theme implementation part
+# Each custom data class is instantiated only once, then the same instance is reused at every refresh:
+# data must be read in as_numeric() / as_string(), not in __init__() which is only run on first refresh
 
 import math
 import platform
 from abc import ABC, abstractmethod
+from collections import deque
 from typing import List
 
+# Python version does not change while running: get it once instead of parsing sys.version on each refresh
+PYTHON_VERSION = platform.python_version()
+
 
 # Custom data classes must be implemented in this file, inherit the CustomDataSource and implement its 2 methods
 class CustomDataSource(ABC):
@@ -53,8 +59,13 @@ class CustomDataSource(ABC):
 
 # Example for a custom data class that has numeric and text values
 class ExampleCustomNumericData(CustomDataSource):
-    # This list is used to store the last 10 values to display a line graph
-    last_val = [math.nan] * 10  # By default, it is filed with math.nan values to indicate there is no data stored
+    # This fixed-size deque is used to store the last 10 values to display a line graph
+    # By default, it is filed with math.nan values to indicate there is no data stored
+    last_val = deque([math.nan] * 10, maxlen=10)
+
+    # Latest numeric value, updated by as_numeric() and formatted by as_string()
+    # Initialized to math.nan so as_string() does not depend on as_numeric() being called first
+    value = math.nan
 
     def as_numeric(self) -> float:
         # Numeric value will be used for graph and radial progress bars
@@ -62,10 +73,9 @@ class ExampleCustomNumericData(CustomDataSource):
         # Example: self.value = my_module.get_rgb_led_brightness() / audio.system_volume() ...
         self.value = 75.845
 
-        # Store the value to the history list that will be used for line graph
+        # Store the value to the history that will be used for line graph
+        # The oldest value is dropped automatically since the deque is full
         self.last_val.append(self.value)
-        # Also remove the oldest value from history list
-        self.last_val.pop(0)
 
         return self.value
 
@@ -78,12 +88,13 @@ class ExampleCustomNumericData(CustomDataSource):
         return f'{self.value:>5.1f}%'
         # Important note! If your numeric value can vary in size, be sure to display it with a default size.
         # E.g. if your value can range from 0 to 9999, you need to display it with at least 4 characters every time.
-        # --> return f'{self.as_numeric():>4}%'
+        # --> return f'{self.value:>4}%'
         # Otherwise, part of the previous value can stay displayed ("ghosting") after a refresh
+        # Reuse the value read by as_numeric(): calling as_numeric() again here would read the data twice per refresh
 
     def last_values(self) -> List[float]:
         # List of last numeric values will be used for plot graph
-        return self.last_val
+        return list(self.last_val)
 
 
 # Example for a custom data class that only has text values
@@ -94,7 +105,7 @@ class ExampleCustomTextOnlyData(CustomDataSource):
 
     def as_string(self) -> str:
         # If a custom data class only has text values, it won't be possible to display graph or radial bars
-        return "Python: " + platform.python_version()
+        return "Python: " + PYTHON_VERSION
 
     def last_values(self) -> List[float]:
         # If a custom data class only has text values, it won't be possible to display line graph
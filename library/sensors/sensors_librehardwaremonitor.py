@@ -264,6 +264,9 @@ class Gpu(sensors.Gpu):
     # Latest FPS value is backed up in case next reading returns no value
     prev_fps = 0
 
+    # GPU hardware updated at the beginning of current refresh, shared by all GPU sensors readings of this refresh
+    updated_gpu = None
+
     # Get GPU to use for sensors, and update it
     @classmethod
     def get_gpu_to_use(cls):
@@ -275,10 +278,22 @@ class Gpu(sensors.Gpu):
 
         return gpu_to_use
 
+    # Update GPU once per refresh: stats(), fps(), fan_percent() and frequency() read the values of this update
+    @classmethod
+    def update(cls):
+        cls.updated_gpu = cls.get_gpu_to_use()
+
+    # Get GPU updated for current refresh, or update it now if no refresh has been started yet
+    @classmethod
+    def get_updated_gpu(cls):
+        if cls.updated_gpu is None:
+            cls.update()
+        return cls.updated_gpu
+
     @classmethod
     def stats(cls) -> Tuple[
         float, float, float, float, float]:  # load (%) / used mem (%) / used mem (Mb) / total mem (Mb) / temp (°C)
-        gpu_to_use = cls.get_gpu_to_use()
+        gpu_to_use = cls.get_updated_gpu()
         if gpu_to_use is None:
             # GPU not supported
             return math.nan, math.nan, math.nan, math.nan, math.nan
@@ -317,7 +332,7 @@ class Gpu(sensors.Gpu):
 
     @classmethod
     def fps(cls) -> int:
-        gpu_to_use = cls.get_gpu_to_use()
+        gpu_to_use = cls.get_updated_gpu()
         if gpu_to_use is None:
             # GPU not supported
             return -1
@@ -338,7 +353,7 @@ class Gpu(sensors.Gpu):
 
     @classmethod
     def fan_percent(cls) -> float:
-        gpu_to_use = cls.get_gpu_to_use()
+        gpu_to_use = cls.get_updated_gpu()
         if gpu_to_use is None:
             # GPU not supported
             return math.nan
@@ -355,7 +370,7 @@ class Gpu(sensors.Gpu):
 
     @classmethod
     def frequency(cls) -> float:
-        gpu_to_use = cls.get_gpu_to_use()
+        gpu_to_use = cls.get_updated_gpu()
         if gpu_to_use is None:
             # GPU not supported
             return math.nan
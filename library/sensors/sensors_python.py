@@ -50,6 +50,9 @@ except:
 
 PNIC_BEFORE = {}
 
+# Latest network counters, read once per refresh by Net.update() and shared by all interfaces (e.g. WLO and ETH cards)
+PNIC_AFTER = None
+
 
 class GpuType(IntEnum):
     UNSUPPORTED = auto()
@@ -60,6 +63,16 @@ class GpuType(IntEnum):
 DETECTED_GPU = GpuType.UNSUPPORTED
 
 
+# Fan info returned by sensors_fans(), with speed percentage instead of psutil raw value
+sfan = namedtuple('sfan', ['label', 'current', 'percent'])
+
+# hwmon devices seen by the last sensors_fans() scan (hwmonN -> sysfs device path) and their fan entries
+# Fan entries are searched again only when these devices change: a device can appear when its driver is loaded
+# after startup, or be removed / renumbered after a driver reload or a GPU reset
+HWMON_DEVICES = None
+HWMON_FAN_BASENAMES = []
+
+
 # Function inspired of psutil/psutil/_pslinux.py:sensors_fans()
 # Adapted to also get fan speed percentage instead of raw value
 def sensors_fans():
@@ -75,15 +88,28 @@ def sensors_fans():
     from psutil._common import bcat, cat
     import collections, glob, os
 
+    global HWMON_DEVICES, HWMON_FAN_BASENAMES
+
     ret = collections.defaultdict(list)
-    basenames = glob.glob('/sys/class/hwmon/hwmon*/fan*_*')
-    if not basenames:
-        # CentOS has an intermediate /device directory:
-        # https://github.com/giampaolo/psutil/issues/971
-        basenames = glob.glob('/sys/class/hwmon/hwmon*/device/fan*_*')
-
-    basenames = sorted(set([x.split('_')[0] for x in basenames]))
-    for base in basenames:
+
+    # Listing hwmon devices is much cheaper than searching for the fan entries of all devices
+    try:
+        hwmon_devices = {name: os.readlink(os.path.join('/sys/class/hwmon', name))
+                         for name in os.listdir('/sys/class/hwmon')}
+    except (IOError, OSError):
+        hwmon_devices = {}
+
+    if hwmon_devices != HWMON_DEVICES:
+        basenames = glob.glob('/sys/class/hwmon/hwmon*/fan*_*')
+        if not basenames:
+            # CentOS has an intermediate /device directory:
+            # https://github.com/giampaolo/psutil/issues/971
+            basenames = glob.glob('/sys/class/hwmon/hwmon*/device/fan*_*')
+
+        HWMON_DEVICES = hwmon_devices
+        HWMON_FAN_BASENAMES = sorted(set([x.split('_')[0] for x in basenames]))
+
+    for base in HWMON_FAN_BASENAMES:
         try:
             current_rpm = int(bcat(base + '_input'))
 
@@ -109,8 +135,7 @@ def sensors_fans():
         unit_name = cat(os.path.join(os.path.dirname(base), 'name')).strip()
         label = cat(base + '_label', fallback=os.path.basename(base)).strip()
 
-        custom_sfan = namedtuple('sfan', ['label', 'current', 'percent'])
-        ret[unit_name].append(custom_sfan(label, current_rpm, percent))
+        ret[unit_name].append(sfan(label, current_rpm, percent))
 
     return dict(ret)
 
@@ -119,6 +144,31 @@ def is_cpu_fan(label: str) -> bool:
     return ("cpu" in label.lower()) or ("proc" in label.lower())
 
 
+def gpu_fan_percent() -> float:
+    # Search for a GPU fan in hardware fans: shared by all GPU types
+    fans = sensors_fans()
+    if fans:
+        for name, entries in fans.items():
+            for entry in entries:
+                if "gpu" in (entry.label.lower() or name.lower()):
+                    return entry.percent
+
+    return math.nan
+
+
+# pyamdgpuinfo GPU handle: GPUs are detected once, then the same handle is queried on each refresh
+AMD_GPU = None
+
+
+def get_amd_gpu():
+    global AMD_GPU
+
+    if AMD_GPU is None:
+        pyamdgpuinfo.detect_gpus()
+        AMD_GPU = pyamdgpuinfo.get_gpu(0)
+    return AMD_GPU
+
+
 class Cpu(sensors.Cpu):
     @staticmethod
     def percentage(interval: float) -> float:
@@ -287,16 +337,9 @@ class GpuNvidia(sensors.Gpu):
     @staticmethod
     def fan_percent() -> float:
         try:
-            fans = sensors_fans()
-            if fans:
-                for name, entries in fans.items():
-                    for entry in entries:
-                        if "gpu" in (entry.label.lower() or name.lower()):
-                            return entry.percent
+            return gpu_fan_percent()
         except:
-            pass
-
-        return math.nan
+            return math.nan
 
     @staticmethod
     def frequency() -> float:
@@ -317,8 +360,7 @@ class GpuAmd(sensors.Gpu):
         float, float, float, float, float]:  # load (%) / used mem (%) / used mem (Mb) / total mem (Mb) / temp (°C)
         if pyamdgpuinfo:
             # Unlike other sensors, AMD GPU with pyamdgpuinfo pulls in all the stats at once
-            pyamdgpuinfo.detect_gpus()
-            amd_gpu = pyamdgpuinfo.get_gpu(0)
+            amd_gpu = get_amd_gpu()
 
             try:
                 memory_used_bytes = amd_gpu.query_vram_usage()
@@ -375,12 +417,9 @@ class GpuAmd(sensors.Gpu):
     def fan_percent() -> float:
         try:
             # Try with psutil fans
-            fans = sensors_fans()
-            if fans:
-                for name, entries in fans.items():
-                    for entry in entries:
-                        if "gpu" in (entry.label.lower() or name.lower()):
-                            return entry.percent
+            fan_percent = gpu_fan_percent()
+            if not math.isnan(fan_percent):
+                return fan_percent
 
             # Try with pyadl if psutil did not find GPU fan
             if pyadl:
@@ -395,8 +434,7 @@ class GpuAmd(sensors.Gpu):
     def frequency() -> float:
         try:
             if pyamdgpuinfo:
-                pyamdgpuinfo.detect_gpus()
-                return pyamdgpuinfo.get_gpu(0).query_sclk() / 1000000
+                return get_amd_gpu().query_sclk() / 1000000
             elif pyadl:
                 return pyadl.ADLManager.getInstance().getDevices()[0].getCurrentEngineClock()
             else:
@@ -437,7 +475,8 @@ class Memory(sensors.Memory):
         try:
             # Do not use psutil.virtual_memory().used: from https://psutil.readthedocs.io/en/latest/#memory
             # "It is calculated differently depending on the platform and designed for informational purposes only"
-            return psutil.virtual_memory().total - psutil.virtual_memory().available
+            memory = psutil.virtual_memory()
+            return memory.total - memory.available
         except:
             return -1
 
@@ -475,12 +514,24 @@ class Disk(sensors.Disk):
 
 
 class Net(sensors.Net):
+    # Get current counters once per refresh: stats() of all interfaces read this snapshot
+    @staticmethod
+    def update():
+        global PNIC_AFTER
+        try:
+            PNIC_AFTER = psutil.net_io_counters(pernic=True)
+        except:
+            # Counters cannot be read: stats() will return an error for all interfaces
+            PNIC_AFTER = None
+
     @staticmethod
     def stats(if_name, interval) -> Tuple[
         int, int, int, int]:  # up rate (B/s), uploaded (B), dl rate (B/s), downloaded (B)
         try:
-            # Get current counters
-            pnic_after = psutil.net_io_counters(pernic=True)
+            if PNIC_AFTER is None:
+                # No counters read for this refresh yet: get them now
+                Net.update()
+            pnic_after = PNIC_AFTER
 
             upload_rate = 0
             uploaded = 0
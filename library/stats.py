@@ -28,7 +28,8 @@ import math
 import os
 import platform
 import sys
-from typing import List
+from collections import deque
+from typing import Deque
 
 import babel.dates
 import requests
@@ -100,7 +101,8 @@ def display_themed_value(theme_data, value, min_size=0, unit=''):
     # overridable MIN_SIZE from theme with backward compatibility
     min_size = theme_data.get("MIN_SIZE", min_size)
 
-    text = f"{{:>{min_size}}}".format(value)
+    # Right-align value on min_size characters, without building and parsing a new format string every refresh
+    text = str(value).rjust(min_size)
     if theme_data.get("SHOW_UNIT", True) and unit:
         text += str(unit)
 
@@ -165,7 +167,7 @@ def display_themed_radial_bar(theme_data, value, min_size=0, unit='', custom_tex
         if custom_text:
             text = custom_text
         else:
-            text = f"{{:>{min_size}}}".format(value)
+            text = str(value).rjust(min_size)
             if theme_data.get("SHOW_UNIT", True) and unit:
                 text += str(unit)
     else:
@@ -243,25 +245,22 @@ def display_themed_line_graph(theme_data, values):
     )
 
 
-def save_last_value(value: float, last_values: List[float], history_size: int):
-    # Initialize last values list the first time with given size
+def save_last_value(value: float, last_values: Deque[float], history_size: int):
+    # Initialize last values history the first time with given size, filled with NaN (no data)
     if len(last_values) != history_size:
-        last_values[:] = last_values_list(size=history_size)
-    # Store the value to the list that can then be used for line graph
+        last_values.clear()
+        last_values.extend([math.nan] * history_size)
+    # Store the value to the history that can then be used for line graph
     last_values.append(value)
-    # Also remove the oldest value from list
-    last_values.pop(0)
-
-
-def last_values_list(size: int) -> List[float]:
-    return [math.nan] * size
+    # Also remove the oldest value from the history, to keep its size constant
+    last_values.popleft()
 
 
 class CPU:
-    last_values_cpu_percentage = []
-    last_values_cpu_temperature = []
-    last_values_cpu_fan_speed = []
-    last_values_cpu_frequency = []
+    last_values_cpu_percentage = deque()
+    last_values_cpu_temperature = deque()
+    last_values_cpu_fan_speed = deque()
+    last_values_cpu_frequency = deque()
 
     @classmethod
     def percentage(cls):
@@ -374,15 +373,17 @@ class CPU:
 
 
 class Gpu:
-    last_values_gpu_percentage = []
-    last_values_gpu_mem_percentage = []
-    last_values_gpu_temperature = []
-    last_values_gpu_fps = []
-    last_values_gpu_fan_speed = []
-    last_values_gpu_frequency = []
+    last_values_gpu_percentage = deque()
+    last_values_gpu_mem_percentage = deque()
+    last_values_gpu_temperature = deque()
+    last_values_gpu_fps = deque()
+    last_values_gpu_fan_speed = deque()
+    last_values_gpu_frequency = deque()
 
     @classmethod
     def stats(cls):
+        # Poll GPU once, then read all its sensors from this update
+        sensors.Gpu.update()
         load, memory_percentage, memory_used_mb, total_memory_mb, temperature = sensors.Gpu.stats()
         fps = sensors.Gpu.fps()
         fan_percent = sensors.Gpu.fan_percent()
@@ -600,8 +601,8 @@ class Gpu:
 
 
 class Memory:
-    last_values_memory_swap = []
-    last_values_memory_virtual = []
+    last_values_memory_swap = deque()
+    last_values_memory_virtual = deque()
 
     @classmethod
     def stats(cls):
@@ -622,28 +623,32 @@ class Memory:
         display_themed_percent_value(memory_stats_theme_data['VIRTUAL']['PERCENT_TEXT'], virtual_percent)
         display_themed_line_graph(memory_stats_theme_data['VIRTUAL']['LINE_GRAPH'], cls.last_values_memory_virtual)
 
+        # Read used/free memory only once: they are used for both individual values and total
+        virtual_used = sensors.Memory.virtual_used()
+        virtual_free = sensors.Memory.virtual_free()
+
         display_themed_value(
             theme_data=memory_stats_theme_data['VIRTUAL']['USED'],
-            value=int(sensors.Memory.virtual_used() / 1024 ** 2),
+            value=int(virtual_used / 1024 ** 2),
             min_size=5,
             unit=" M"
         )
         display_themed_value(
             theme_data=memory_stats_theme_data['VIRTUAL']['FREE'],
-            value=int(sensors.Memory.virtual_free() / 1024 ** 2),
+            value=int(virtual_free / 1024 ** 2),
             min_size=5,
             unit=" M"
         )
         display_themed_value(
             theme_data=memory_stats_theme_data['VIRTUAL']['TOTAL'],
-            value=int((sensors.Memory.virtual_free() + sensors.Memory.virtual_used()) / 1024 ** 2),
+            value=int((virtual_free + virtual_used) / 1024 ** 2),
             min_size=5,
             unit=" M"
         )
 
 
 class Disk:
-    last_values_disk_usage = []
+    last_values_disk_usage = deque()
 
     @classmethod
     def stats(cls):
@@ -681,15 +686,17 @@ class Disk:
 
 
 class Net:
-    last_values_wlo_upload = []
-    last_values_wlo_download = []
-    last_values_eth_upload = []
-    last_values_eth_download = []
+    last_values_wlo_upload = deque()
+    last_values_wlo_download = deque()
+    last_values_eth_upload = deque()
+    last_values_eth_download = deque()
 
     @classmethod
     def stats(cls):
         net_theme_data = config.THEME_DATA['STATS']['NET']
         interval = net_theme_data.get("INTERVAL", None)
+        # Read counters of all interfaces once, then get WLO and ETH stats from this snapshot
+        sensors.Net.update()
         upload_wlo, uploaded_wlo, download_wlo, downloaded_wlo = sensors.Net.stats(WLO_CARD, interval)
 
         save_last_value(upload_wlo, cls.last_values_wlo_upload,
@@ -722,7 +729,7 @@ class Net:
     def _show_themed_total_data(theme_data, amount):
         display_themed_value(
             theme_data=theme_data,
-            value=f"{bytes2human(amount)}",
+            value=bytes2human(amount),
             min_size=6
         )
 
@@ -730,20 +737,17 @@ class Net:
     def _show_themed_tax_rate(theme_data, rate):
         display_themed_value(
             theme_data=theme_data,
-            value=f"{bytes2human(rate, '%(value).1f %(symbol)s/s')}",
+            value=bytes2human(rate, '%(value).1f %(symbol)s/s'),
             min_size=10
         )
 
 
 class Date:
-    @staticmethod
-    def stats():
-        if HW_SENSORS == "STATIC":
-            # For static sensors, use predefined date/time
-            date_now = datetime.datetime.fromtimestamp(1694014609)
-        else:
-            date_now = datetime.datetime.now()
+    # Locale used to format date/time is detected once, and saved for future refreshes
+    lc_time = None
 
+    @staticmethod
+    def _get_lc_time() -> str:
         try:
             if platform.system() == "Windows":
                 # Windows does not have LC_TIME environment variable, use deprecated getdefaultlocale() that returns language code following RFC 1766
@@ -756,19 +760,33 @@ class Date:
         if not lc_time:
             lc_time = "en_US"
 
+        return lc_time
+
+    @classmethod
+    def stats(cls):
+        if HW_SENSORS == "STATIC":
+            # For static sensors, use predefined date/time
+            date_now = datetime.datetime.fromtimestamp(1694014609)
+        else:
+            date_now = datetime.datetime.now()
+
+        if cls.lc_time is None:
+            cls.lc_time = cls._get_lc_time()
+        lc_time = cls.lc_time
+
         date_theme_data = config.THEME_DATA['STATS']['DATE']
         day_theme_data = date_theme_data['DAY']['TEXT']
         date_format = day_theme_data.get("FORMAT", 'medium')
         display_themed_value(
             theme_data=day_theme_data,
-            value=f"{babel.dates.format_date(date_now, format=date_format, locale=lc_time)}"
+            value=babel.dates.format_date(date_now, format=date_format, locale=lc_time)
         )
 
         hour_theme_data = date_theme_data['HOUR']['TEXT']
         time_format = hour_theme_data.get("FORMAT", 'medium')
         display_themed_value(
             theme_data=hour_theme_data,
-            value=f"{babel.dates.format_time(date_now, format=time_format, locale=lc_time)}"
+            value=babel.dates.format_time(date_now, format=time_format, locale=lc_time)
         )
 
 
@@ -799,14 +817,22 @@ class SystemUptime:
 
 
 class Custom:
-    @staticmethod
-    def stats():
-        for custom_stat in config.THEME_DATA['STATS']['CUSTOM']:
+    # Custom sensor classes are instantiated once, and their instance is reused for future refreshes
+    custom_stat_instances = {}
+
+    @classmethod
+    def stats(cls):
+        custom_stats_theme_data = config.THEME_DATA['STATS']['CUSTOM']
+        for custom_stat in custom_stats_theme_data:
             if custom_stat != "INTERVAL":
+                custom_stat_theme_data = custom_stats_theme_data[custom_stat]
 
                 # Load the custom sensor class from sensors_custom.py based on the class name
                 try:
-                    custom_stat_class = getattr(sensors_custom, str(custom_stat))()
+                    custom_stat_class = cls.custom_stat_instances.get(custom_stat)
+                    if custom_stat_class is None:
+                        custom_stat_class = getattr(sensors_custom, str(custom_stat))()
+                        cls.custom_stat_instances[custom_stat] = custom_stat_class
                     numeric_value = custom_stat_class.as_numeric()
                     string_value = custom_stat_class.as_string()
                     last_values = custom_stat_class.last_values()
@@ -819,17 +845,17 @@ class Custom:
                     string_value = str(numeric_value)
 
                 # Display text
-                theme_data = config.THEME_DATA['STATS']['CUSTOM'][custom_stat].get("TEXT", None)
+                theme_data = custom_stat_theme_data.get("TEXT", None)
                 if theme_data is not None and string_value is not None:
                     display_themed_value(theme_data=theme_data, value=string_value)
 
                 # Display graph from numeric value
-                theme_data = config.THEME_DATA['STATS']['CUSTOM'][custom_stat].get("GRAPH", None)
+                theme_data = custom_stat_theme_data.get("GRAPH", None)
                 if theme_data is not None and numeric_value is not None and not math.isnan(numeric_value):
                     display_themed_progress_bar(theme_data=theme_data, value=numeric_value)
 
                 # Display radial from numeric and text value
-                theme_data = config.THEME_DATA['STATS']['CUSTOM'][custom_stat].get("RADIAL", None)
+                theme_data = custom_stat_theme_data.get("RADIAL", None)
                 if theme_data is not None and numeric_value is not None and not math.isnan(
                         numeric_value) and string_value is not None:
                     display_themed_radial_bar(
@@ -839,7 +865,7 @@ class Custom:
                     )
 
                 # Display plot graph from histo values
-                theme_data = config.THEME_DATA['STATS']['CUSTOM'][custom_stat].get("LINE_GRAPH", None)
+                theme_data = custom_stat_theme_data.get("LINE_GRAPH", None)
                 if theme_data is not None and last_values is not None:
                     display_themed_line_graph(theme_data=theme_data, values=last_values)
 
@@ -917,7 +943,7 @@ class Weather:
 
 
 class Ping:
-    last_values_ping = []
+    last_values_ping = deque()
 
     @classmethod
     def stats(cls):
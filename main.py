@@ -82,12 +82,12 @@ if __name__ == "__main__":
         # Waiting for all pending request to be sent to display
         logger.info("Waiting for all pending request to be sent to display (%ds max)..." % timeout)
 
-        wait_time = 0
-        while not scheduler.is_queue_empty() and wait_time < timeout:
+        # Measure elapsed time with a monotonic clock rather than adding up sleep durations
+        start_time = time.monotonic()
+        while not scheduler.is_queue_empty() and time.monotonic() - start_time < timeout:
             time.sleep(0.1)
-            wait_time = wait_time + 0.1
 
-        logger.debug("(Waited %.1fs)" % wait_time)
+        logger.debug("(Waited %.1fs)" % (time.monotonic() - start_time))
 
     def clean_stop(tray_icon=None):
         # Turn screen and LEDs off before stopping
@@ -0,0 +1,35 @@
+import unittest
+
+from PIL import Image
+
+from library.lcd.serialize import image_to_compressed_BGRA
+
+from .sample_image import generate_sample_image
+
+
+def reference_compressed_BGRA(image: Image.Image) -> bytes:
+    # Per-pixel packing: B and G keep their 6 upper bits, 4-bit alpha is spread over their 2 lower bits
+    compressed_bgra = bytearray()
+    image_data = image.convert("RGBA").load()
+    for h in range(image.height):
+        for w in range(image.width):
+            r, g, b, a = image_data[w, h]
+            a = a >> 4
+            compressed_bgra.append(b & 0xFC | a >> 2)
+            compressed_bgra.append(g & 0xFC | a & 2)
+            compressed_bgra.append(r)
+    return bytes(compressed_bgra)
+
+
+class TestSerialize(unittest.TestCase):
+    def test_image_to_compressed_BGRA_rgba(self):
+        # Non-square image with an alpha gradient covering all 16 packed alpha levels
+        image = generate_sample_image(37, 21).convert("RGBA")
+        image.putalpha(Image.linear_gradient("L").resize(image.size))
+
+        self.assertEqual(image_to_compressed_BGRA(image), (reference_compressed_BGRA(image), 3))
+
+    def test_image_to_compressed_BGRA_rgb(self):
+        image = generate_sample_image(37, 21)
+
+        self.assertEqual(image_to_compressed_BGRA(image), (reference_compressed_BGRA(image), 3))
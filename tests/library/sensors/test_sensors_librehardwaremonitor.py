@@ -0,0 +1,120 @@
+import importlib
+import sys
+import types
+import unittest
+from enum import Enum, auto
+from unittest import mock
+
+
+# Minimal stand-ins for the LibreHardwareMonitor .NET types, so that the LHM sensors can be tested on any platform
+class HardwareType(Enum):
+    Cpu = auto()
+    GpuNvidia = auto()
+    GpuAmd = auto()
+    GpuIntel = auto()
+    Memory = auto()
+    Motherboard = auto()
+    Storage = auto()
+    Network = auto()
+
+
+class SensorType(Enum):
+    Load = auto()
+    SmallData = auto()
+    Temperature = auto()
+    Factor = auto()
+    Control = auto()
+    Clock = auto()
+
+
+class FakeSensor:
+    def __init__(self, sensor_type, name, value):
+        self.SensorType = sensor_type
+        self.Name = name
+        self.Value = value
+
+
+class FakeHardware:
+    def __init__(self, hardware_type, name, sensors):
+        self.HardwareType = hardware_type
+        self.Name = name
+        self.Sensors = sensors
+        self.SubHardware = []
+        self.update_count = 0
+
+    def Update(self):
+        self.update_count += 1
+
+
+class FakeComputer:
+    # Hardware list returned by LibreHardwareMonitor, set by each test before importing the sensors module
+    Hardware = []
+
+    def Open(self):
+        pass
+
+
+def fake_modules():
+    lhm = types.ModuleType("LibreHardwareMonitor")
+    lhm.Hardware = types.SimpleNamespace(HardwareType=HardwareType, SensorType=SensorType, Computer=FakeComputer,
+                                         Hardware=FakeHardware)
+
+    win32api = types.ModuleType("win32api")
+    win32api.GetFileVersionInfo = lambda path, name: {'FileVersionMS': 0, 'FileVersionLS': 0}
+    win32api.HIWORD = lambda value: 0
+    win32api.LOWORD = lambda value: 0
+
+    return {
+        "clr": mock.Mock(),
+        "psutil": mock.Mock(),
+        "win32api": win32api,
+        "LibreHardwareMonitor": lhm,
+    }
+
+
+class TestSensorsLibreHardwareMonitor(unittest.TestCase):
+    def setUp(self):
+        self.gpu = FakeHardware(HardwareType.GpuNvidia, "NVIDIA GeForce", [
+            FakeSensor(SensorType.Load, "GPU Core", 50.0),
+            FakeSensor(SensorType.SmallData, "GPU Memory Used", 1024.0),
+            FakeSensor(SensorType.SmallData, "GPU Memory Total", 4096.0),
+            FakeSensor(SensorType.Temperature, "GPU Core", 60.0),
+            FakeSensor(SensorType.Factor, "FPS", 120.0),
+            FakeSensor(SensorType.Control, "GPU Fan", 40.0),
+            FakeSensor(SensorType.Clock, "GPU Core", 1500.0),
+        ])
+        FakeComputer.Hardware = [self.gpu]
+
+        # sys.modules is restored at the end of the test: sensors module is imported again by each test
+        modules_patch = mock.patch.dict(sys.modules, fake_modules())
+        modules_patch.start()
+        self.addCleanup(modules_patch.stop)
+        windll_patch = mock.patch("ctypes.windll", create=True)
+        windll_patch.start().shell32.IsUserAnAdmin.return_value = 1
+        self.addCleanup(windll_patch.stop)
+        sys.modules.pop("library.sensors.sensors_librehardwaremonitor", None)
+
+        self.sensors = importlib.import_module("library.sensors.sensors_librehardwaremonitor")
+
+    def refresh_gpu(self):
+        # Same sequence of calls as stats.Gpu.stats()
+        self.sensors.Gpu.update()
+        stats = self.sensors.Gpu.stats()
+        return stats, self.sensors.Gpu.fps(), self.sensors.Gpu.fan_percent(), self.sensors.Gpu.frequency()
+
+    def test_gpu_updated_once_per_refresh(self):
+        self.assertTrue(self.sensors.Gpu.is_available())
+        self.gpu.update_count = 0
+
+        self.assertEqual(self.refresh_gpu(), ((50.0, 25.0, 1024.0, 4096.0, 60.0), 120, 40.0, 1500.0))
+        self.assertEqual(self.gpu.update_count, 1)
+
+        self.assertEqual(self.refresh_gpu(), ((50.0, 25.0, 1024.0, 4096.0, 60.0), 120, 40.0, 1500.0))
+        self.assertEqual(self.gpu.update_count, 2)
+
+    def test_gpu_updated_when_read_before_first_refresh(self):
+        self.assertTrue(self.sensors.Gpu.is_available())
+        self.gpu.update_count = 0
+
+        self.assertEqual(self.sensors.Gpu.frequency(), 1500.0)
+        self.assertEqual(self.gpu.update_count, 1)